@@ -1,22 +1,48 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional, Dict, Any
-import json
-import time
+from typing import Optional, Dict, Any, Callable
+import logging
 
-from models.types import AppView, MQTTConfig, ConnectionStatus
+import orjson
+
+from models.types import AppView, MQTTConfig, ConnectionStatus, InboxMessage
 from ui.styles import StyleManager
 from ui.views import (
     ViewCallbacks, ConnectionView, ModeSelectionView, 
     ProducerView, ObserverView
 )
-from mqtt.client import MQTTManager
+from mqtt.client import MQTTManager, SYNC_PAYLOAD
 from utils.helpers import format_timestamp
+from utils.riot import shutdown_executor
+
+
+log = logging.getLogger("chronospy")
+
+# Maximum received MQTT messages dispatched to the views in one pass
+INBOX_BATCH_SIZE = 100
+
+# Keeps "Successfully connected" on screen for a moment before leaving the connection view
+CONNECTED_STATUS_MS = 150
+
+# Fixed action payloads, serialized once straight to bytes
+JOIN_PAYLOAD = orjson.dumps({"action": "JOIN"})
+LEAVE_PAYLOAD = orjson.dumps({"action": "LEAVE"})
+
+# ASSIGN has a fixed shape, so it is filled in with bytes formatting instead of a JSON encoder
+_ASSIGN_TEMPLATE = b'{"action":"ASSIGN","time_ms":%d}'
+
+# Views that consume received MQTT messages
+_MESSAGE_VIEWS = frozenset((AppView.PRODUCER, AppView.OBSERVER))
 
 
 class ChronosPYApp:
     """Main ChronosPY application with complete type hints"""
     
+    __slots__ = (
+        "root", "style_manager", "mqtt_manager", "current_view", "connection_status",
+        "main_frame", "views", "_view_factories",
+    )
+    
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
         self._setup_window()
@@ -52,26 +78,35 @@ class ChronosPYApp:
         self.root.protocol("WM_DELETE_WINDOW", self._on_window_closing)
     
     def _setup_views(self) -> None:
-        """Configure all views"""
+        """Configure view factories and the initial view"""
         callbacks = ViewCallbacksImpl(self)
         
-        self.views[AppView.CONNECTION] = ConnectionView(
-            self.main_frame, self.style_manager, callbacks
-        )
-        self.views[AppView.MODE_SELECTION] = ModeSelectionView(
-            self.main_frame, self.style_manager, callbacks
-        )
-        self.views[AppView.PRODUCER] = ProducerView(
-            self.main_frame, self.style_manager, callbacks
-        )
-        self.views[AppView.OBSERVER] = ObserverView(
-            self.main_frame, self.style_manager, callbacks
-        )
+        # Views share the same grid cell; switching only raises/removes their frames
+        self.main_frame.grid_rowconfigure(0, weight=1)
+        self.main_frame.grid_columnconfigure(0, weight=1)
+        
+        self._view_factories: Dict[AppView, Callable[[], Any]] = {
+            AppView.CONNECTION: lambda: ConnectionView(
+                self.main_frame, self.style_manager, callbacks
+            ),
+            AppView.MODE_SELECTION: lambda: ModeSelectionView(
+                self.main_frame, self.style_manager, callbacks
+            ),
+            AppView.PRODUCER: lambda: ProducerView(
+                self.main_frame, self.style_manager, callbacks
+            ),
+            AppView.OBSERVER: lambda: ObserverView(
+                self.main_frame, self.style_manager, callbacks
+            ),
+        }
+        
+        # Only the initial view is built up front; the rest are created on first use
+        self.views[AppView.CONNECTION] = self._view_factories[AppView.CONNECTION]()
     
     def _setup_mqtt_callbacks(self) -> None:
         """Configure MQTT callbacks"""
         self.mqtt_manager.set_connection_callback(self._on_mqtt_connection_changed)
-        self.mqtt_manager.set_message_callback(self._on_mqtt_message_received)
+        self.mqtt_manager.set_inbox_callback(self._drain_inbox)
     
     def _show_view(self, view: AppView) -> None:
         """
@@ -81,13 +116,16 @@ class ChronosPYApp:
             view: View to display
         """
         # Hide current view
-        if self.current_view in self.views:
-            self.views[self.current_view].hide()
+        view_obj = self.views.get(self.current_view)
+        if view_obj:
+            view_obj.hide()
         
-        # Show new view
+        # Show new view, building it the first time it is needed
         self.current_view = view
-        if view in self.views:
-            self.views[view].show()
+        view_obj = self.views.get(view)
+        if view_obj is None:
+            view_obj = self.views[view] = self._view_factories[view]()
+        view_obj.show()
     
     def _on_mqtt_connection_changed(self, is_connected: bool) -> None:
         """
@@ -99,37 +137,39 @@ class ChronosPYApp:
         if is_connected:
             self.connection_status = ConnectionStatus.CONNECTED
             self._update_connection_status("Successfully connected")
-            # Change to mode selection after 1 second
-            self.root.after(1000, lambda: self._show_view(AppView.MODE_SELECTION))
+            self.root.after(CONNECTED_STATUS_MS, lambda: self._show_view(AppView.MODE_SELECTION))
         else:
             self.connection_status = ConnectionStatus.DISCONNECTED
             self._update_connection_status("Disconnected")
     
-    def _on_mqtt_message_received(self, topic: str, payload: str, timestamp: str) -> None:
+    def _drain_inbox(self) -> None:
+        """Dispatch pending MQTT messages in a single pass"""
+        try:
+            messages = self.mqtt_manager.drain_messages(INBOX_BATCH_SIZE)
+            if messages:
+                self._on_mqtt_messages_received(messages)
+        finally:
+            # Whatever didn't fit in this batch is handled as soon as Tk is idle again
+            if self.mqtt_manager.has_pending_messages:
+                self.root.after_idle(self._drain_inbox)
+    
+    def _on_mqtt_messages_received(self, messages: list[InboxMessage]) -> None:
         """
-        Callback for received MQTT messages.
+        Callback for a batch of received MQTT messages.
         
         Args:
-            topic: Message topic
-            payload: Message content
-            timestamp: Message timestamp
+            messages: (topic, payload, timestamp) tuples in arrival order
         """
-        print(f"[DEBUG] MQTT message received:")
-        print(f"  Topic: {topic}")
-        print(f"  Payload: {payload}")
-        print(f"  Timestamp: {timestamp}")
-        print(f"  Current view: {self.current_view}")
+        if log.isEnabledFor(logging.DEBUG):
+            for topic, payload, timestamp in messages:
+                log.debug("MQTT message received: topic=%s payload=%s timestamp=%s",
+                          topic, payload, timestamp)
+            log.debug("Current view: %s", self.current_view)
         
         # Process according to active view
-        if self.current_view == AppView.PRODUCER:
-            print(f"[DEBUG] Processing message in PRODUCER view")
-            producer_view = self.views[AppView.PRODUCER]
-            producer_view.add_message(topic, payload, timestamp)
-            
-        elif self.current_view == AppView.OBSERVER:
-            print(f"[DEBUG] Processing message in OBSERVER view")
-            observer_view = self.views[AppView.OBSERVER]
-            observer_view.add_received_message(topic, payload, timestamp)
+        if self.current_view in _MESSAGE_VIEWS:
+            log.debug("Processing %d messages in %s view", len(messages), self.current_view.name)
+            self.views[self.current_view].add_messages_bulk(messages)
     
     def _update_connection_status(self, status: str) -> None:
         """
@@ -142,44 +182,57 @@ class ChronosPYApp:
             connection_view = self.views[AppView.CONNECTION]
             connection_view.update_status(status)
     
+    def send_leave_if_needed(self, wait_timeout: Optional[float] = None) -> None:
+        """
+        Send LEAVE for the joined room if we're leaving observer mode while connected.
+        
+        Args:
+            wait_timeout: If set, wait up to this many seconds for the LEAVE to be sent
+        """
+        if self.current_view != AppView.OBSERVER or not self.mqtt_manager.is_connected:
+            return
+        
+        topic = self.views[AppView.OBSERVER].get_current_topic()
+        if not topic:
+            return
+        
+        try:
+            info = self.mqtt_manager.publish(topic, LEAVE_PAYLOAD)
+            if wait_timeout is not None:
+                info.wait_for_publish(timeout=wait_timeout)
+        except Exception as e:
+            # Don't show error to user since they're leaving, just log
+            log.warning("Error sending LEAVE message: %s", e)
+    
     def _on_window_closing(self) -> None:
         """Handle window closing"""
-        # If we're in observer view and a user is connected, send LEAVE
-        if self.current_view == AppView.OBSERVER and self.mqtt_manager.is_connected:
-            observer_view = self.views[AppView.OBSERVER]
-            room_id = observer_view.get_current_room_id()
-            username = observer_view.get_current_username()
-            
-            if room_id and username:
-                try:
-                    # Send JSON message with LEAVE action
-                    topic = f"{room_id}/{username}"
-                    payload = json.dumps({"action": "LEAVE"})
-                    
-                    self.mqtt_manager.publish(topic, payload)
-                    
-                    # Give some time for the message to be sent
-                    time.sleep(0.1)
-                    
-                except Exception as e:
-                    print(f"Error sending LEAVE message: {str(e)}")
+        # Wait for the LEAVE to be written, the connection is closed right after
+        self.send_leave_if_needed(wait_timeout=0.5)
         
         if self.mqtt_manager.is_connected:
             self.mqtt_manager.disconnect()
+        shutdown_executor()
         self.root.destroy()
 
 
 class ViewCallbacksImpl:
     """Implementation of view callbacks"""
     
+    __slots__ = ("app",)
+    
     def __init__(self, app: ChronosPYApp) -> None:
         self.app = app
     
     def on_connect_requested(self, config: MQTTConfig) -> None:
         """Handle connection request"""
+        self.app._update_connection_status("Connecting...")
+        # Repaint pending widgets only (no input events), then connect from the main loop
+        self.app.root.update_idletasks()
+        self.app.root.after(0, lambda: self._connect(config))
+    
+    def _connect(self, config: MQTTConfig) -> None:
+        """Connect to the MQTT broker"""
         try:
-            self.app._update_connection_status("Connecting...")
-            self.app.root.update()
             self.app.mqtt_manager.connect(config)
         except Exception as e:
             messagebox.showerror("Connection Error", str(e))
@@ -196,105 +249,64 @@ class ViewCallbacksImpl:
     def on_room_joined(self, room_id: str, username: str) -> None:
         """Handle room join"""
         try:
-            print(f"[DEBUG] Observer joining room:")
-            print(f"  Room ID: {room_id}")
-            print(f"  Username: {username}")
+            log.debug("Observer joining room: room_id=%s username=%s", room_id, username)
             
             observer_view = self.app.views[AppView.OBSERVER]
             observer_view.update_join_status(room_id, username)
             
             # Subscribe to user's topic
-            topic = f"{room_id}/{username}"
-            print(f"[DEBUG] Observer subscribing to topic: {topic}")
+            topic = observer_view.get_current_topic()
+            log.debug("Observer subscribing to topic: %s", topic)
             self.app.mqtt_manager.subscribe(topic)
             
             # Send JSON message with JOIN action
-            payload = json.dumps({"action": "JOIN"})
-            print(f"[DEBUG] Observer sending message:")
-            print(f"  Topic: {topic}")
-            print(f"  Payload: {payload}")
+            payload = JOIN_PAYLOAD
+            log.debug("Observer sending message: topic=%s payload=%s", topic, payload)
             
             self.app.mqtt_manager.publish(topic, payload)
-            print(f"[DEBUG] JOIN message sent successfully")
+            log.debug("JOIN message sent successfully")
             
             # Show sent message in interface
             timestamp = format_timestamp()
             observer_view.add_sent_message(topic, payload, timestamp)
             
         except Exception as e:
-            print(f"[DEBUG] Error in on_room_joined: {str(e)}")
+            log.error("Error in on_room_joined: %s", e)
             messagebox.showerror("Error", f"Error sending join message: {str(e)}")
     
     def on_sync_requested(self) -> None:
         """Handle synchronization request"""
         try:
             observer_view = self.app.views[AppView.OBSERVER]
-            room_id = observer_view.get_current_room_id()
-            username = observer_view.get_current_username()
+            topic = observer_view.get_current_topic()
             
-            if not room_id or not username:
+            if not topic:
                 messagebox.showerror("Error", "You must join a room first")
                 return
             
-            print(f"[DEBUG] Sending sync request:")
-            print(f"  Room ID: {room_id}")
-            print(f"  Username: {username}")
+            log.debug("Sending sync request: topic=%s", topic)
             
             # Send sync message
-            sync_message = self.app.mqtt_manager.publish_sync_message(room_id, username)
+            sync_message = self.app.mqtt_manager.publish_sync_message(topic)
             
             # Show in interface
             timestamp = format_timestamp()
-            topic = f"{room_id}/{username}"
-            payload = json.dumps({"action": "SYNC_REQ"})
+            payload = SYNC_PAYLOAD
             
             observer_view.add_sent_message(topic, payload, timestamp)
             
         except Exception as e:
-            print(f"[DEBUG] Error in on_sync_requested: {str(e)}")
+            log.error("Error in on_sync_requested: %s", e)
             messagebox.showerror("Error", f"Error sending message: {str(e)}")
     
     def on_back_requested(self) -> None:
         """Handle back request"""
-        # If we're in observer view and a user is connected, send LEAVE
-        if self.app.current_view == AppView.OBSERVER:
-            observer_view = self.app.views[AppView.OBSERVER]
-            room_id = observer_view.get_current_room_id()
-            username = observer_view.get_current_username()
-            
-            if room_id and username:
-                try:
-                    # Send JSON message with LEAVE action
-                    topic = f"{room_id}/{username}"
-                    payload = json.dumps({"action": "LEAVE"})
-                    
-                    self.app.mqtt_manager.publish(topic, payload)
-                    
-                except Exception as e:
-                    # Don't show error to user since they're leaving, just log
-                    print(f"Error sending LEAVE message: {str(e)}")
-        
+        self.app.send_leave_if_needed()
         self.app._show_view(AppView.MODE_SELECTION)
     
     def on_disconnect_requested(self) -> None:
         """Handle disconnect request"""
-        # If we're in observer view and a user is connected, send LEAVE
-        if self.app.current_view == AppView.OBSERVER:
-            observer_view = self.app.views[AppView.OBSERVER]
-            room_id = observer_view.get_current_room_id()
-            username = observer_view.get_current_username()
-            
-            if room_id and username:
-                try:
-                    # Send JSON message with LEAVE action
-                    topic = f"{room_id}/{username}"
-                    payload = json.dumps({"action": "LEAVE"})
-                    
-                    self.app.mqtt_manager.publish(topic, payload)
-                    
-                except Exception as e:
-                    print(f"Error sending LEAVE message: {str(e)}")
-        
+        self.app.send_leave_if_needed()
         self.app.mqtt_manager.disconnect()
         self.app._show_view(AppView.CONNECTION)
     
@@ -303,38 +315,37 @@ class ViewCallbacksImpl:
         producer_view = self.app.views[AppView.PRODUCER]
         room_id = producer_view.get_room_id()
         
-        print(f"[DEBUG] Setting up producer mode")
-        print(f"  Room ID: {room_id}")
+        log.debug("Setting up producer mode: room_id=%s", room_id)
         
         if room_id:
             # Subscribe to room topic
             topic = f"{room_id}/#"
-            print(f"[DEBUG] Subscribing to topic: {topic}")
+            log.debug("Subscribing to topic: %s", topic)
             try:
                 self.app.mqtt_manager.subscribe(topic)
-                print(f"[DEBUG] Successfully subscribed to topic: {topic}")
+                log.debug("Successfully subscribed to topic: %s", topic)
             except Exception as e:
-                print(f"[DEBUG] Subscription error: {str(e)}")
+                log.error("Subscription error: %s", e)
                 messagebox.showerror("Error", f"Error subscribing to topic: {str(e)}")
         else:
-            print(f"[DEBUG] No room_id available")
+            log.debug("No room_id available")
     
-    def on_assign_user(self, username: str, time_ms: int) -> None:
-        """Handle user time assignment"""
+    def on_assign_user(self, assignments: Dict[str, int]) -> None:
+        """Handle time assignment for one or more users"""
         try:
             if self.app.current_view == AppView.PRODUCER:
                 producer_view = self.app.views[AppView.PRODUCER]
                 room_id = producer_view.get_room_id()
                 
-                if room_id and username:
-                    # Send assignment message
-                    topic = f"{room_id}/{username}"
-                    payload = json.dumps({
-                        "action": "ASSIGN",
-                        "time_ms": time_ms
-                    })
+                if room_id:
+                    # Send every assignment in a single flush
+                    msgs = [
+                        (producer_view.get_user_topic(username), _ASSIGN_TEMPLATE % int(time_ms))
+                        for username, time_ms in assignments.items()
+                        if username
+                    ]
                     
-                    self.app.mqtt_manager.publish(topic, payload)
+                    self.app.mqtt_manager.publish_many(msgs)
                     
         except Exception as e:
             messagebox.showerror("Error", f"Error sending assignment: {str(e)}")
@@ -348,8 +359,8 @@ class ViewCallbacksImpl:
                 
                 if room_id and username:
                     # Send forced LEAVE message
-                    topic = f"{room_id}/{username}"
-                    payload = json.dumps({"action": "LEAVE"})
+                    topic = producer_view.get_user_topic(username)
+                    payload = LEAVE_PAYLOAD
                     
                     self.app.mqtt_manager.publish(topic, payload)
                     
@@ -359,29 +370,25 @@ class ViewCallbacksImpl:
         except Exception as e:
             messagebox.showerror("Error", f"Error removing user: {str(e)}")
     
-    def on_send_time_request(self, topic: str, payload: str) -> None:
+    def on_send_time_request(self, topic: str, payload: bytes) -> None:
         """Handle TIME_REQ sending from producer"""
         try:
-            print(f"[DEBUG] Sending TIME_REQ via MQTT:")
-            print(f"  Topic: {topic}")
-            print(f"  Payload: {payload}")
+            log.debug("Sending TIME_REQ via MQTT: topic=%s payload=%s", topic, payload)
             
             self.app.mqtt_manager.publish(topic, payload)
-            print(f"[DEBUG] TIME_REQ sent successfully")
+            log.debug("TIME_REQ sent successfully")
             
         except Exception as e:
-            print(f"[DEBUG] Error sending TIME_REQ: {str(e)}")
+            log.error("Error sending TIME_REQ: %s", e)
             messagebox.showerror("Error", f"Error sending TIME_REQ: {str(e)}")
     
-    def on_send_time_response(self, topic: str, payload: str) -> None:
+    def on_send_time_response(self, topic: str, payload: bytes) -> None:
         """Handle TIME_RESPONSE sending from observer"""
         try:
-            print(f"[DEBUG] Sending TIME_RESPONSE via MQTT:")
-            print(f"  Topic: {topic}")
-            print(f"  Payload: {payload}")
+            log.debug("Sending TIME_RESPONSE via MQTT: topic=%s payload=%s", topic, payload)
             
             self.app.mqtt_manager.publish(topic, payload)
-            print(f"[DEBUG] TIME_RESPONSE sent successfully")
+            log.debug("TIME_RESPONSE sent successfully")
             
             # Show in observer interface
             if self.app.current_view == AppView.OBSERVER:
@@ -390,7 +397,7 @@ class ViewCallbacksImpl:
                 observer_view.add_sent_message(topic, payload, timestamp)
             
         except Exception as e:
-            print(f"[DEBUG] Error sending TIME_RESPONSE: {str(e)}")
+            log.error("Error sending TIME_RESPONSE: %s", e)
             messagebox.showerror("Error", f"Error sending TIME_RESPONSE: {str(e)}")
 
 
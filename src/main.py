@@ -1,9 +1,30 @@
 #!/usr/bin/env python3
 
+import logging
+import logging.handlers
+import queue
+
+import tkthread
+tkthread.patch()  # Must run before any Tk root is created
+
 from app import create_app
 
 
+def setup_logging() -> logging.handlers.QueueListener:
+    # Records are written to stderr from a background thread, never from the Tk thread
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    
+    logging.basicConfig(level=logging.WARNING, handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
 def main() -> None:
+    listener = setup_logging()
+    
     try:
         app = create_app()
         
@@ -14,6 +35,8 @@ def main() -> None:
     except Exception as e:
         print(f"Fatal error in the application: {e}")
         raise
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
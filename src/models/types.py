@@ -20,7 +20,7 @@ class ConnectionStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MQTTConfig:
     """Configuración de conexión MQTT"""
     url: str
@@ -28,24 +28,21 @@ class MQTTConfig:
     keepalive: int = 60
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SyncMessage:
     """Mensaje de sincronización"""
     type: str
 
-    @classmethod
-    def create(cls, room_id: str) -> 'SyncMessage':
-        """Crear un nuevo mensaje de sincronización"""
-        return cls(
-            type="SYNC_REQ",
-        )
 
+# Inmutable, así que una única instancia sirve para todas las peticiones
+SYNC_REQ_MESSAGE = SyncMessage(type="SYNC_REQ")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ReceivedMessage:
     """Mensaje recibido por MQTT"""
     topic: str
-    payload: str
+    payload: bytes
     timestamp: str
 
 
@@ -72,5 +69,6 @@ class MQTTClientProtocol(Protocol):
 
 
 # Type aliases
-MessageCallback = Callable[[str, str, str], None]
+MessageCallback = Callable[[str, bytes, str], None]
+InboxMessage = tuple[str, bytes, str]  # (topic, raw payload, timestamp)
 ConnectionCallback = Callable[[bool], None] 
\ No newline at end of file
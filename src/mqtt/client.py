@@ -1,20 +1,55 @@
-import json
+import logging
+import queue
+from functools import lru_cache
 from typing import Optional, Callable, Any
+import orjson
 import paho.mqtt.client as mqtt
+import tkthread
 from datetime import datetime
 
-from models.types import MQTTConfig, SyncMessage, ReceivedMessage, MessageCallback, ConnectionCallback
+from models.types import (
+    MQTTConfig, SyncMessage, SYNC_REQ_MESSAGE, ReceivedMessage, ConnectionCallback, InboxMessage
+)
 from utils.helpers import format_timestamp
 
 
+log = logging.getLogger("chronospy")
+
+# Limits for paho's outgoing message queues
+MAX_INFLIGHT_MESSAGES = 20
+MAX_QUEUED_MESSAGES = 1000
+
+# Received messages waiting for the UI; the oldest ones are dropped when full
+INBOX_SIZE = 10000
+
+SYNC_PAYLOAD = orjson.dumps({"action": "SYNC_REQ"})
+
+
+@lru_cache(maxsize=256)
+def _encode_payload(payload: str) -> bytes:
+    # Most payloads are a handful of fixed strings; encode each one only once
+    return payload.encode("utf-8")
+
+
 class MQTTManager:
     
+    __slots__ = (
+        "_client", "_is_connected", "_config", "_on_connection_callback",
+        "_inbox", "_on_inbox_callback", "_inbox_signaled",
+    )
+    
     def __init__(self) -> None:
         self._client: Optional[mqtt.Client] = None
         self._is_connected: bool = False
         self._config: Optional[MQTTConfig] = None
-        self._on_message_callback: Optional[MessageCallback] = None
         self._on_connection_callback: Optional[ConnectionCallback] = None
+        
+        # Incoming messages are queued by paho's thread and drained by the UI
+        self._inbox: queue.Queue[InboxMessage] = queue.Queue(maxsize=INBOX_SIZE)
+        
+        # The UI is woken once per burst: only when the inbox goes from drained to non-empty
+        self._on_inbox_callback: Optional[Callable[[], None]] = None
+        self._inbox_signaled: bool = False
     
     @property
     def is_connected(self) -> bool:
@@ -24,17 +59,23 @@ class MQTTManager:
     def config(self) -> Optional[MQTTConfig]:
         return self._config
     
-    def set_message_callback(self, callback: MessageCallback) -> None:
-        self._on_message_callback = callback
+    @property
+    def has_pending_messages(self) -> bool:
+        return not self._inbox.empty()
     
     def set_connection_callback(self, callback: ConnectionCallback) -> None:
         self._on_connection_callback = callback
     
+    def set_inbox_callback(self, callback: Callable[[], None]) -> None:
+        self._on_inbox_callback = callback
+    
     def connect(self, config: MQTTConfig) -> None:
 
         try:
             self._config = config
             self._client = mqtt.Client()
+            self._client.max_inflight_messages_set(MAX_INFLIGHT_MESSAGES)
+            self._client.max_queued_messages_set(MAX_QUEUED_MESSAGES)
             
             self._client.on_connect = self._on_connect
             self._client.on_disconnect = self._on_disconnect
@@ -62,52 +103,77 @@ class MQTTManager:
         
         self._client.subscribe(topic)
     
-    def publish_sync_message(self, room_id: str, username: str) -> SyncMessage:
+    def publish_sync_message(self, topic: str) -> SyncMessage:
 
         if not self._client or not self._is_connected:
             raise RuntimeError("Not connected to the MQTT broker")
         
-        sync_message = SyncMessage.create(room_id)
-        topic = f"{room_id}/{username}"
-        payload = json.dumps({
-            "action": "SYNC_REQ"
-        })
+        log.debug("Sending SYNC_REQ: topic=%s payload=%s", topic, SYNC_PAYLOAD)
+        
+        self.publish(topic, SYNC_PAYLOAD)
+        return SYNC_REQ_MESSAGE
+    
+    def publish(self, topic: str, payload: str | bytes) -> mqtt.MQTTMessageInfo:
+
+        if not self._client or not self._is_connected:
+            raise RuntimeError("No está conectado al broker MQTT")
         
-        print(f"[DEBUG] Sending SYNC_REQ:")
-        print(f"  Topic: {topic}")
-        print(f"  Payload: {payload}")
+        if isinstance(payload, str):
+            payload = _encode_payload(payload)
         
-        self._client.publish(topic, payload)
-        return sync_message
+        return self._client.publish(topic, payload)
     
-    def publish(self, topic: str, payload: str) -> None:
+    def publish_many(self, msgs: list[tuple[str, str | bytes]]) -> None:
 
         if not self._client or not self._is_connected:
             raise RuntimeError("No está conectado al broker MQTT")
         
-        self._client.publish(topic, payload)
+        for topic, payload in msgs:
+            self.publish(topic, payload)
+    
+    def drain_messages(self, max_items: int) -> list[InboxMessage]:
+
+        # Cleared before draining, so a message queued from now on wakes the UI again
+        self._inbox_signaled = False
+        messages = []
+        try:
+            while len(messages) < max_items:
+                messages.append(self._inbox.get_nowait())
+        except queue.Empty:
+            pass
+        return messages
     
     def _on_connect(self, client: mqtt.Client, userdata: Any, flags: dict, rc: int) -> None:
 
+        # paho callbacks run on its network thread; Tk work is handed to the main thread
         self._is_connected = (rc == 0)
         if self._on_connection_callback:
-            self._on_connection_callback(self._is_connected)
+            tkthread.call_nosync(self._on_connection_callback, self._is_connected)
     
     def _on_disconnect(self, client: mqtt.Client, userdata: Any, rc: int) -> None:
 
         self._is_connected = False
         if self._on_connection_callback:
-            self._on_connection_callback(False)
+            tkthread.call_nosync(self._on_connection_callback, False)
     
     def _on_message(self, client: mqtt.Client, userdata: Any, msg: mqtt.MQTTMessage) -> None:
 
         try:
+            # Payloads stay as raw bytes; consumers decode only if they need text
             topic = msg.topic
-            payload = msg.payload.decode('utf-8')
+            payload = msg.payload
             timestamp = format_timestamp()
             
-            if self._on_message_callback:
-                self._on_message_callback(topic, payload, timestamp)
+            item = (topic, payload, timestamp)
+            try:
+                self._inbox.put_nowait(item)
+            except queue.Full:
+                self._inbox.get_nowait()
+                self._inbox.put_nowait(item)
+            
+            if not self._inbox_signaled and self._on_inbox_callback:
+                self._inbox_signaled = True
+                tkthread.call_nosync(self._on_inbox_callback)
                 
         except Exception as e:
-            print(f"Error processing MQTT message: {e}") 
\ No newline at end of file
+            log.error("Error processing MQTT message: %s", e)
\ No newline at end of file
@@ -1,14 +1,37 @@
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Any, Callable
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Mapping, Optional
 
 from models.types import StyleColors
 
 
+def _bind_hover(btn: tk.Button, normal_bg: str, hover_bg: str,
+                normal_fg: Optional[str] = None, hover_fg: Optional[str] = None) -> None:
+    normal = {'bg': normal_bg}
+    hover = {'bg': hover_bg}
+    if normal_fg and hover_fg:
+        normal['fg'] = normal_fg
+        hover['fg'] = hover_fg
+    
+    def on_enter(e):
+        if btn['state'] == 'normal':
+            btn.config(**hover)
+    
+    def on_leave(e):
+        if btn['state'] == 'normal':
+            btn.config(**normal)
+    
+    btn.bind("<Enter>", on_enter)
+    btn.bind("<Leave>", on_leave)
+
+
 class StyleManager:
     
+    __slots__ = ("_colors", "_button_opts", "_button_hover")
+    
     def __init__(self) -> None:
-        self._colors: Dict[str, str] = {
+        self._colors: Mapping[str, str] = MappingProxyType({
             'bg_primary': StyleColors.BG_PRIMARY,
             'bg_secondary': StyleColors.BG_SECONDARY,
             'bg_accent': StyleColors.BG_ACCENT,
@@ -17,113 +40,61 @@ class StyleManager:
             'purple_light': StyleColors.PURPLE_LIGHT,
             'text_primary': StyleColors.TEXT_PRIMARY,
             'text_secondary': StyleColors.TEXT_SECONDARY,
+        })
+        
+        # Button options are built once and reused for every button of the same style
+        self._button_opts: Dict[str, Dict[str, Any]] = {
+            'primary': {
+                'bg': self._colors['purple_primary'],
+                'fg': 'white',
+                'font': ('Segoe UI', 10, 'bold'),
+                'relief': 'flat',
+                'borderwidth': 0,
+                'padx': 20,
+                'pady': 10,
+                'cursor': 'hand2',
+            },
+            'secondary': {
+                'bg': self._colors['bg_accent'],
+                'fg': self._colors['text_primary'],
+                'font': ('Segoe UI', 10),
+                'relief': 'solid',
+                'borderwidth': 1,
+                'padx': 15,
+                'pady': 8,
+                'cursor': 'hand2',
+                'highlightbackground': self._colors['purple_primary'],
+                'highlightcolor': self._colors['purple_primary'],
+                'highlightthickness': 1,
+            },
+            'big': {
+                'bg': self._colors['purple_primary'],
+                'fg': 'white',
+                'font': ('Segoe UI', 14, 'bold'),
+                'relief': 'flat',
+                'borderwidth': 0,
+                'padx': 30,
+                'pady': 15,
+                'cursor': 'hand2',
+            },
+        }
+        
+        # (normal_bg, hover_bg, normal_fg, hover_fg) per button style
+        self._button_hover: Dict[str, tuple[str, str, Optional[str], Optional[str]]] = {
+            'primary': (self._colors['purple_primary'], self._colors['purple_secondary'], None, None),
+            'secondary': (self._colors['bg_accent'], self._colors['purple_primary'],
+                          self._colors['text_primary'], 'white'),
+            'big': (self._colors['purple_primary'], self._colors['purple_secondary'], None, None),
         }
     
     def create_button(self, parent: tk.Widget, text: str, command: Callable, 
                      style: str = "primary", state: str = "normal") -> tk.Button:
 
-        if style == "primary":
-            return self._create_primary_button(parent, text, command, state)
-        elif style == "secondary":
-            return self._create_secondary_button(parent, text, command, state)
-        elif style == "big":
-            return self._create_big_button(parent, text, command, state)
-        else:
-            return self._create_primary_button(parent, text, command, state)
-    
-    def _create_primary_button(self, parent: tk.Widget, text: str, 
-                              command: Callable, state: str) -> tk.Button:
-        btn = tk.Button(
-            parent,
-            text=text,
-            command=command,
-            bg=self._colors['purple_primary'],
-            fg='white',
-            font=('Segoe UI', 10, 'bold'),
-            relief='flat',
-            borderwidth=0,
-            padx=20,
-            pady=10,
-            cursor='hand2',
-            state=state
-        )
-        
-        def on_enter(e):
-            if btn['state'] == 'normal':
-                btn.config(bg=self._colors['purple_secondary'])
-        
-        def on_leave(e):
-            if btn['state'] == 'normal':
-                btn.config(bg=self._colors['purple_primary'])
-        
-        btn.bind("<Enter>", on_enter)
-        btn.bind("<Leave>", on_leave)
-        
-        return btn
-    
-    def _create_secondary_button(self, parent: tk.Widget, text: str, 
-                                command: Callable, state: str) -> tk.Button:
-
-        btn = tk.Button(
-            parent,
-            text=text,
-            command=command,
-            bg=self._colors['bg_accent'],
-            fg=self._colors['text_primary'],
-            font=('Segoe UI', 10),
-            relief='solid',
-            borderwidth=1,
-            padx=15,
-            pady=8,
-            cursor='hand2',
-            state=state,
-            highlightbackground=self._colors['purple_primary'],
-            highlightcolor=self._colors['purple_primary'],
-            highlightthickness=1
-        )
-        
-        def on_enter(e):
-            if btn['state'] == 'normal':
-                btn.config(bg=self._colors['purple_primary'], fg='white')
-        
-        def on_leave(e):
-            if btn['state'] == 'normal':
-                btn.config(bg=self._colors['bg_accent'], fg=self._colors['text_primary'])
-        
-        btn.bind("<Enter>", on_enter)
-        btn.bind("<Leave>", on_leave)
-        
-        return btn
-    
-    def _create_big_button(self, parent: tk.Widget, text: str, 
-                          command: Callable, state: str) -> tk.Button:
-
-        btn = tk.Button(
-            parent,
-            text=text,
-            command=command,
-            bg=self._colors['purple_primary'],
-            fg='white',
-            font=('Segoe UI', 14, 'bold'),
-            relief='flat',
-            borderwidth=0,
-            padx=30,
-            pady=15,
-            cursor='hand2',
-            state=state
-        )
-        
-        def on_enter(e):
-            if btn['state'] == 'normal':
-                btn.config(bg=self._colors['purple_secondary'])
-        
-        def on_leave(e):
-            if btn['state'] == 'normal':
-                btn.config(bg=self._colors['purple_primary'])
-        
-        btn.bind("<Enter>", on_enter)
-        btn.bind("<Leave>", on_leave)
+        if style not in self._button_opts:
+            style = "primary"
         
+        btn = tk.Button(parent, text=text, command=command, state=state, **self._button_opts[style])
+        _bind_hover(btn, *self._button_hover[style])
         return btn
     
     def create_label(self, parent: tk.Widget, text: str, style: str = "normal") -> tk.Label:
@@ -208,6 +179,6 @@ class StyleManager:
         }
     
     @property
-    def colors(self) -> Dict[str, str]:
-        """Acceder a los colores del tema"""
-        return self._colors.copy() 
\ No newline at end of file
+    def colors(self) -> Mapping[str, str]:
+        """Acceder a los colores del tema (solo lectura)"""
+        return self._colors 
\ No newline at end of file
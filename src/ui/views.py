@@ -2,14 +2,29 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional, Callable, Protocol
 from abc import ABC, abstractmethod
-import json
+from dataclasses import dataclass
+import logging
 import keyboard
+import orjson
 
-from models.types import AppView, MQTTConfig
+from models.types import AppView, MQTTConfig, InboxMessage
 from utils.helpers import validate_mqtt_config, validate_room_id, validate_username, generate_room_id, format_timestamp
 from ui.styles import StyleManager
 
-from utils.riot import get_current_time, set_time
+from concurrent.futures import Future
+
+from utils.riot import get_current_time_async, set_time_async
+
+
+log = logging.getLogger("chronospy")
+
+# Window over which JOIN/LEAVE messages are collected before the user list is updated
+MEMBERSHIP_FLUSH_MS = 50
+
+# Fixed-schema outbound payloads, filled by %-formatting instead of building and encoding a dict
+_TIME_REQ_TEMPLATE = b'{"action":"TIME_REQ","requester":%s,"requester_delay":%d,"main_observer_delay":%d}'
+_SYNC_RESPONSE_TEMPLATE = b'{"action":"SYNC_RESPONSE","value":%.3f}'
+
 
 class ViewCallbacks(Protocol):
     def on_connect_requested(self, config: MQTTConfig) -> None: ...
@@ -18,10 +33,23 @@ class ViewCallbacks(Protocol):
     def on_sync_requested(self) -> None: ...
     def on_back_requested(self) -> None: ...
     def on_disconnect_requested(self) -> None: ...
-    def on_assign_user(self, username: str, time_ms: int) -> None: ...
+    def on_assign_user(self, assignments: dict[str, int]) -> None: ...
     def on_remove_user(self, username: str) -> None: ...
-    def on_send_time_request(self, topic: str, payload: str) -> None: ...
-    def on_send_time_response(self, topic: str, payload: str) -> None: ...
+    def on_send_time_request(self, topic: str, payload: bytes) -> None: ...
+    def on_send_time_response(self, topic: str, payload: bytes) -> None: ...
+
+
+@dataclass(slots=True)
+class UserRow:
+    """Widgets of one producer user row; rows are recycled between users"""
+    frame: tk.Frame
+    name_label: tk.Label
+    time_entry: tk.Entry
+    time_var: tk.StringVar
+    main_radio: ttk.Radiobutton
+    username: str = ""
+    # Last parsed value of time_var, so sync requests don't read it back from Tk
+    cached_time: int = 1000
 
 
 class BaseView(ABC):
@@ -29,19 +57,41 @@ class BaseView(ABC):
         self.parent = parent
         self.style_manager = style_manager
         self.callbacks = callbacks
-        self._widgets: list[tk.Widget] = []
+        self._built: bool = False
+        
+        # Every view lives in its own frame, stacked in the same grid cell of the parent
+        self.frame = style_manager.create_frame(parent)
+        self.frame.grid(row=0, column=0, sticky="nsew")
+        self.frame.grid_remove()
     
-    @abstractmethod
     def show(self) -> None:
-        pass
+        if not self._built:
+            self._build()
+            self._built = True
+        self._on_show()
+        self.frame.grid()
+        self.frame.tkraise()
     
     def hide(self) -> None:
-        for widget in self._widgets:
-            widget.destroy()
-        self._widgets.clear()
+        self.frame.grid_remove()
+    
+    def add_messages_bulk(self, items: list[InboxMessage]) -> None:
+        # One bad message must not drop the rest of the batch
+        for topic, payload, timestamp in items:
+            try:
+                self.add_message(topic, payload, timestamp)
+            except Exception as e:
+                log.error("Error processing MQTT message on %s: %s", topic, e)
+    
+    def add_message(self, topic: str, payload: bytes, timestamp: str) -> None:
+        pass
+    
+    @abstractmethod
+    def _build(self) -> None:
+        pass
     
-    def _add_widget(self, widget: tk.Widget) -> None:
-        self._widgets.append(widget)
+    def _on_show(self) -> None:
+        pass
 
 
 class ConnectionView(BaseView):
@@ -51,18 +101,15 @@ class ConnectionView(BaseView):
         self.port_entry: Optional[tk.Entry] = None
         self.status_label: Optional[tk.Label] = None
     
-    def show(self) -> None:
-        title_label = self.style_manager.create_label(self.parent, "ChronosPY", "title")
+    def _build(self) -> None:
+        title_label = self.style_manager.create_label(self.frame, "ChronosPY", "title")
         title_label.pack(pady=(0, 10))
-        self._add_widget(title_label)
         
-        subtitle_label = self.style_manager.create_label(self.parent, "Connect to MQTT Broker", "subtitle")
+        subtitle_label = self.style_manager.create_label(self.frame, "Connect to MQTT Broker", "subtitle")
         subtitle_label.pack(pady=(0, 30))
-        self._add_widget(subtitle_label)
         
-        connection_frame = self.style_manager.create_frame(self.parent)
+        connection_frame = self.style_manager.create_frame(self.frame)
         connection_frame.pack(pady=20)
-        self._add_widget(connection_frame)
         
         url_label = self.style_manager.create_label(connection_frame, "Broker URL:", "normal")
         url_label.grid(row=0, column=0, sticky="w", padx=(0, 10), pady=10)
@@ -79,14 +126,15 @@ class ConnectionView(BaseView):
         self.port_entry.insert(0, "1883")
         
         connect_btn = self.style_manager.create_button(
-            self.parent, "CONNECT", self._on_connect_clicked, "primary"
+            self.frame, "CONNECT", self._on_connect_clicked, "primary"
         )
         connect_btn.pack(pady=30)
-        self._add_widget(connect_btn)
         
-        self.status_label = self.style_manager.create_label(self.parent, "Disconnected", "status")
+        self.status_label = self.style_manager.create_label(self.frame, "Disconnected", "status")
         self.status_label.pack(pady=10)
-        self._add_widget(self.status_label)
+    
+    def _on_show(self) -> None:
+        self.update_status("Disconnected")
     
     def update_status(self, status: str) -> None:
         if self.status_label:
@@ -109,71 +157,75 @@ class ConnectionView(BaseView):
 
 
 class ModeSelectionView(BaseView):
-    def show(self) -> None:
-        title_label = self.style_manager.create_label(self.parent, "Select Mode", "title")
+    def _build(self) -> None:
+        title_label = self.style_manager.create_label(self.frame, "Select Mode", "title")
         title_label.pack(pady=(0, 30))
-        self._add_widget(title_label)
         
         producer_btn = self.style_manager.create_button(
-            self.parent, "CONNECT AS PRODUCER", 
+            self.frame, "CONNECT AS PRODUCER", 
             lambda: self.callbacks.on_mode_selected("producer"), "big"
         )
         producer_btn.pack(pady=20)
-        self._add_widget(producer_btn)
         
         observer_btn = self.style_manager.create_button(
-            self.parent, "CONNECT AS OBSERVER",
+            self.frame, "CONNECT AS OBSERVER",
             lambda: self.callbacks.on_mode_selected("observer"), "big"
         )
         observer_btn.pack(pady=20)
-        self._add_widget(observer_btn)
         
         back_btn = self.style_manager.create_button(
-            self.parent, "Back to Connection", 
+            self.frame, "Back to Connection", 
             self.callbacks.on_disconnect_requested, "secondary"
         )
         back_btn.pack(pady=(30, 0))
-        self._add_widget(back_btn)
 
 
 class ProducerView(BaseView):
     def __init__(self, parent: tk.Frame, style_manager: StyleManager, callbacks: ViewCallbacks) -> None:
         super().__init__(parent, style_manager, callbacks)
         self.room_id: Optional[str] = None
-        self.connected_users: dict = {}
+        self.connected_users: dict[str, UserRow] = {}
+        self._pool: list[UserRow] = []
         self.users_frame: Optional[tk.Frame] = None
         self.main_observer_var: Optional[tk.StringVar] = None
+        self.room_id_label: Optional[tk.Label] = None
+        self.sub_label: Optional[tk.Label] = None
+        self._topics: dict[str, str] = {}
+        
+        self._digits_vcmd: Optional[str] = None
+        
+        # Cached MAIN OBSERVER selection, so sync requests don't read the radio group back from Tk
+        self._main_observer: Optional[str] = None
+        
+        # Latest JOIN (True) / LEAVE (False) per user, applied together on the next flush
+        self._pending_members: dict[str, bool] = {}
+        self._flush_scheduled: bool = False
     
-    def show(self) -> None:
-        self.room_id = generate_room_id()
+    def _build(self) -> None:
         self.main_observer_var = tk.StringVar()
+        self.main_observer_var.trace_add("write", self._on_main_observer_changed)
+        self._digits_vcmd = self.frame.register(str.isdecimal)
         
-        title_label = self.style_manager.create_label(self.parent, "Producer Mode", "title")
+        title_label = self.style_manager.create_label(self.frame, "Producer Mode", "title")
         title_label.pack(pady=(0, 20))
-        self._add_widget(title_label)
         
-        room_frame = self.style_manager.create_frame(self.parent)
+        room_frame = self.style_manager.create_frame(self.frame)
         room_frame.pack(pady=20)
-        self._add_widget(room_frame)
         
         room_label = self.style_manager.create_label(room_frame, "Room ID:", "normal")
         room_label.pack(side="left", padx=(0, 10))
         
-        room_id_label = self.style_manager.create_label(room_frame, self.room_id, "subtitle")
-        room_id_label.pack(side="left")
+        self.room_id_label = self.style_manager.create_label(room_frame, "", "subtitle")
+        self.room_id_label.pack(side="left")
         
-        topic = f"{self.room_id}/#"
-        sub_label = self.style_manager.create_label(self.parent, f"Subscribed to: {topic}", "normal")
-        sub_label.pack(pady=10)
-        self._add_widget(sub_label)
+        self.sub_label = self.style_manager.create_label(self.frame, "", "normal")
+        self.sub_label.pack(pady=10)
         
-        users_label = self.style_manager.create_label(self.parent, "Connected Users:", "subtitle")
+        users_label = self.style_manager.create_label(self.frame, "Connected Users:", "subtitle")
         users_label.pack(pady=(20, 10))
-        self._add_widget(users_label)
         
-        users_container = self.style_manager.create_frame(self.parent)
+        users_container = self.style_manager.create_frame(self.frame)
         users_container.pack(fill="both", expand=True, pady=10)
-        self._add_widget(users_container)
         
         canvas = tk.Canvas(users_container, bg=self.style_manager.colors['bg_secondary'], height=200)
         scrollbar = ttk.Scrollbar(users_container, orient="vertical", command=canvas.yview)
@@ -196,89 +248,124 @@ class ProducerView(BaseView):
         canvas.bind("<Configure>", configure_scroll_region)
         
         back_btn = self.style_manager.create_button(
-            self.parent, "Back", self.callbacks.on_back_requested, "secondary"
+            self.frame, "Back", self.callbacks.on_back_requested, "secondary"
         )
         back_btn.pack(pady=10)
-        self._add_widget(back_btn)
+    
+    def _on_show(self) -> None:
+        # Every visit to producer mode opens a fresh room
+        self._pending_members.clear()
+        for username in list(self.connected_users):
+            self.remove_user(username)
+        
+        self.room_id = generate_room_id()
+        self._topics.clear()
+        if self.room_id_label:
+            self.room_id_label.config(text=self.room_id)
+        if self.sub_label:
+            self.sub_label.config(text=f"Subscribed to: {self.room_id}/#")
     
     def get_room_id(self) -> Optional[str]:
         return self.room_id
     
+    def get_user_topic(self, username: str) -> str:
+        topic = self._topics.get(username)
+        if topic is None:
+            topic = self._topics[username] = f"{self.room_id}/{username}"
+        return topic
+    
     def add_user(self, username: str) -> None:
         if username in self.connected_users or not self.users_frame or not self.main_observer_var:
-            print(f"[DEBUG] Exiting add_user without adding user")
+            log.debug("Exiting add_user without adding user")
             return
         
-        print(f"[DEBUG] Creating interface for user: {username}")
+        # Reuse a row left by a previous user when there is one; creating widgets is the slow part
+        if self._pool:
+            log.debug("Reusing row for user: %s", username)
+            row = self._pool.pop()
+        else:
+            log.debug("Creating interface for user: %s", username)
+            row = self._create_user_row()
         
+        row.username = username
+        row.name_label.config(text=username)
+        row.main_radio.config(value=username)
+        row.time_var.set("1000")
+        row.frame.pack(fill="x", padx=5, pady=5)
+        
+        self.connected_users[username] = row
+        
+        log.debug("User %s added successfully. Total users: %d", username, len(self.connected_users))
+    
+    def _create_user_row(self) -> UserRow:
         user_frame = self.style_manager.create_frame(self.users_frame)
-        user_frame.pack(fill="x", padx=5, pady=5)
         
-        name_label = self.style_manager.create_label(user_frame, username, "normal")
+        name_label = self.style_manager.create_label(user_frame, "", "normal")
         name_label.grid(row=0, column=0, sticky="w", padx=(0, 10))
         
         time_label = self.style_manager.create_label(user_frame, "Time (ms):", "normal")
         time_label.grid(row=0, column=1, padx=(0, 5))
         
+        # Only digits can be typed, so the value parses without an exception path
+        time_var = tk.StringVar(self.frame)
         time_entry = self.style_manager.create_entry(user_frame, 10)
+        time_entry.config(textvariable=time_var, validate="key", validatecommand=(self._digits_vcmd, "%S"))
         time_entry.grid(row=0, column=2, padx=(0, 10))
-        time_entry.insert(0, "1000")
         
         main_radio = ttk.Radiobutton(
             user_frame, 
             text="MAIN OBSERVER", 
             variable=self.main_observer_var, 
-            value=username,
             style="Custom.TRadiobutton"
         )
         main_radio.grid(row=0, column=3, padx=(0, 10))
         
+        row = UserRow(user_frame, name_label, time_entry, time_var, main_radio)
+        time_var.trace_add("write", lambda *args: self._on_time_changed(row))
+        
+        # Handlers look up the row's current user, so they stay valid when the row is reused
+        
         assign_btn = self.style_manager.create_button(
             user_frame, "Assign", 
-            lambda u=username: self._on_assign_clicked(u), "primary"
+            lambda: self._on_assign_clicked(row.username), "primary"
         )
         assign_btn.grid(row=0, column=4, padx=(0, 5))
         
         remove_btn = self.style_manager.create_button(
-            user_frame, "✕", lambda u=username: self.remove_user(u), "secondary"
+            user_frame, "✕", lambda: self.remove_user(row.username), "secondary"
         )
         remove_btn.grid(row=0, column=5)
         
-        self.connected_users[username] = {
-            "time_entry": time_entry,
-            "main_var": self.main_observer_var,
-            "frame": user_frame
-        }
-        
-        print(f"[DEBUG] User {username} added successfully. Total users: {len(self.connected_users)}")
+        return row
     
     def remove_user(self, username: str) -> None:
-        if username not in self.connected_users:
+        row = self.connected_users.pop(username, None)
+        if row is None:
             return
         
-        user_data = self.connected_users[username]
-        user_data["frame"].destroy()
+        row.frame.pack_forget()
+        row.username = ""
+        self._pool.append(row)
         
-        if self.main_observer_var and self.main_observer_var.get() == username:
+        if self._main_observer == username:
             self.main_observer_var.set("")
         
-        del self.connected_users[username]
+        self._topics.pop(username, None)
     
     def get_user_time(self, username: str) -> Optional[int]:
-        if username not in self.connected_users:
-            return None
-        
-        try:
-            time_str = self.connected_users[username]["time_entry"].get()
-            return int(time_str)
-        except ValueError:
-            return 1000
+        row = self.connected_users.get(username)
+        return row.cached_time if row else None
     
     def get_main_observer(self) -> Optional[str]:
+        return self._main_observer
+    
+    def _on_main_observer_changed(self, *args) -> None:
         if self.main_observer_var:
-            main = self.main_observer_var.get()
-            return main if main else None
-        return None
+            self._main_observer = self.main_observer_var.get() or None
+    
+    def _on_time_changed(self, row: UserRow) -> None:
+        time_str = row.time_var.get()
+        row.cached_time = int(time_str) if time_str else 1000
     
     def get_all_users_config(self) -> dict:
         config = {}
@@ -292,103 +379,111 @@ class ProducerView(BaseView):
     def _on_assign_clicked(self, username: str) -> None:
         time_ms = self.get_user_time(username)
         if time_ms is not None:
-            self.callbacks.on_assign_user(username, time_ms)
+            self.callbacks.on_assign_user({username: time_ms})
     
-    def add_message(self, topic: str, payload: str, timestamp: str) -> None:
-        print(f"[DEBUG] ProducerView.add_message called:")
-        print(f"  Topic: {topic}")
-        print(f"  Payload: {payload}")
+    def add_message(self, topic: str, payload: bytes, timestamp: str) -> None:
+        log.debug("ProducerView.add_message called: topic=%s payload=%s", topic, payload)
+        
+        # SYNC_REQ is the most frequent message and carries nothing but its action, so skip the parse
+        if b'"SYNC_REQ"' in payload:
+            log.debug("Processing SYNC_REQ")
+            self._handle_sync_request(topic)
+            return
         
         try:
-            data = json.loads(payload)
-            print(f"[DEBUG] JSON parsed successfully: {data}")
+            data = orjson.loads(payload)
+            log.debug("JSON parsed successfully: %s", data)
             
             action = data.get("action")
-            print(f"[DEBUG] Action extracted: {action}")
+            log.debug("Action extracted: %s", action)
             
-            if action == "SYNC_REQ":
-                print(f"[DEBUG] Processing SYNC_REQ")
-                self._handle_sync_request(topic)
-                
-            elif action in ["JOIN", "LEAVE"]:
-                print(f"[DEBUG] Processing action {action}")
+            if action in ["JOIN", "LEAVE"]:
+                log.debug("Processing action %s", action)
                 
-                parts = topic.split("/")
-                print(f"[DEBUG] Topic parts: {parts}")
+                _, sep, username = topic.rpartition("/")
                 
-                if len(parts) >= 2:
-                    username = parts[-1]
-                    print(f"[DEBUG] Username extracted: {username}")
+                if sep:
+                    log.debug("Username extracted: %s", username)
                     
-                    if action == "JOIN":
-                        print(f"[DEBUG] Adding user: {username}")
-                        self.add_user(username)
-                    elif action == "LEAVE":
-                        print(f"[DEBUG] Removing user: {username}")
-                        self.remove_user(username)
+                    log.debug("Queueing %s for user: %s", action, username)
+                    self._queue_membership(username, action == "JOIN")
                 else:
-                    print(f"[DEBUG] Topic doesn't have enough parts: {len(parts)}")
+                    log.debug("Topic has no user level: %s", topic)
             else:
-                print(f"[DEBUG] Unrecognized action: {action}")
+                log.debug("Unrecognized action: %s", action)
                         
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"[DEBUG] Error parsing JSON or missing action: {str(e)}")
+        except (orjson.JSONDecodeError, KeyError) as e:
+            log.debug("Error parsing JSON or missing action: %s", e)
             pass
     
+    def _queue_membership(self, username: str, joined: bool) -> None:
+        self._pending_members[username] = joined
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.parent.after(MEMBERSHIP_FLUSH_MS, self._flush_membership)
+    
+    def _flush_membership(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending_members = self._pending_members, {}
+        
+        # A user who joined and left within the window only has their last action applied
+        for username, joined in pending.items():
+            if joined:
+                self.add_user(username)
+            else:
+                self.remove_user(username)
+    
     def _handle_sync_request(self, topic: str) -> None:
-        print(f"[DEBUG] Handling SYNC_REQ from topic: {topic}")
+        log.debug("Handling SYNC_REQ from topic: %s", topic)
         
-        parts = topic.split("/")
-        if len(parts) < 2:
-            print(f"[DEBUG] Topic has incorrect format: {topic}")
+        _, sep, requester = topic.rpartition("/")
+        if not sep:
+            log.debug("Topic has incorrect format: %s", topic)
             return
         
-        requester = parts[-1]
-        print(f"[DEBUG] Requester extracted: {requester}")
+        log.debug("Requester extracted: %s", requester)
         
         main_observer = self.get_main_observer()
-        print(f"[DEBUG] Current MAIN OBSERVER: {main_observer}")
+        log.debug("Current MAIN OBSERVER: %s", main_observer)
         
         if not main_observer:
-            print(f"[DEBUG] No MAIN OBSERVER configured")
+            log.debug("No MAIN OBSERVER configured")
             return
         
         if not self.room_id:
-            print(f"[DEBUG] No room_id available")
+            log.debug("No room_id available")
             return
         
         requester_delay = self.get_user_time(requester)
         main_observer_delay = self.get_user_time(main_observer)
         
-        print(f"[DEBUG] Requester delay: {requester_delay}ms")
-        print(f"[DEBUG] Main observer delay: {main_observer_delay}ms")
+        log.debug("Requester delay: %sms, main observer delay: %sms", requester_delay, main_observer_delay)
         
         if requester_delay is None:
-            print(f"[DEBUG] Could not get requester delay: {requester}")
+            log.debug("Could not get requester delay: %s", requester)
             requester_delay = 1000
         
         if main_observer_delay is None:
-            print(f"[DEBUG] Could not get main observer delay: {main_observer}")
+            log.debug("Could not get main observer delay: %s", main_observer)
             main_observer_delay = 1000
         
-        time_req_topic = f"{self.room_id}/{main_observer}"
-        time_req_payload = json.dumps({
-            "action": "TIME_REQ",
-            "requester": requester,
-            "requester_delay": requester_delay,
-            "main_observer_delay": main_observer_delay
-        })
+        time_req_topic = self.get_user_topic(main_observer)
+        time_req_payload = _TIME_REQ_TEMPLATE % (
+            # The requester comes from the topic, so it is JSON-encoded rather than pasted in
+            orjson.dumps(requester), requester_delay, main_observer_delay
+        )
         
-        print(f"[DEBUG] Sending TIME_REQ:")
-        print(f"  Topic: {time_req_topic}")
-        print(f"  Payload: {time_req_payload}")
-        print(f"  Requester: {requester} ({requester_delay}ms)")
-        print(f"  Main Observer: {main_observer} ({main_observer_delay}ms)")
+        log.debug("Sending TIME_REQ: topic=%s payload=%s requester=%s (%sms) main_observer=%s (%sms)",
+                  time_req_topic, time_req_payload, requester, requester_delay,
+                  main_observer, main_observer_delay)
         
         self.callbacks.on_send_time_request(time_req_topic, time_req_payload)
 
 
 class ObserverView(BaseView):
+    # The keyboard hook is process-wide, so it is tracked per class rather than per instance
+    _hotkey_registered: bool = False
+    
     def __init__(self, parent: tk.Frame, style_manager: StyleManager, callbacks: ViewCallbacks) -> None:
         super().__init__(parent, style_manager, callbacks)
         self.room_entry: Optional[tk.Entry] = None
@@ -398,16 +493,14 @@ class ObserverView(BaseView):
         self.messages_text: Optional[tk.Text] = None
         self.current_room_id: Optional[str] = None
         self.current_username: Optional[str] = None
-        keyboard.add_hotkey('alt+ctrl+s', self._on_hotkey_pressed, suppress=False)
+        self._topic: Optional[str] = None
     
-    def show(self) -> None:
-        title_label = self.style_manager.create_label(self.parent, "Observer Mode", "title")
+    def _build(self) -> None:
+        title_label = self.style_manager.create_label(self.frame, "Observer Mode", "title")
         title_label.pack(pady=(0, 30))
-        self._add_widget(title_label)
         
-        room_frame = self.style_manager.create_frame(self.parent)
+        room_frame = self.style_manager.create_frame(self.frame)
         room_frame.pack(pady=20)
-        self._add_widget(room_frame)
         
         room_label = self.style_manager.create_label(room_frame, "Room ID:", "normal")
         room_label.grid(row=0, column=0, sticky="w", padx=(0, 10), pady=10)
@@ -427,28 +520,39 @@ class ObserverView(BaseView):
         join_btn.grid(row=0, column=2, rowspan=2, pady=10)
             
         info_label = self.style_manager.create_label(
-            self.parent, 
+            self.frame, 
             "Username: letters, numbers and hyphens only (3-20 characters)", 
             "normal"
         )
         info_label.pack(pady=5)
-        self._add_widget(info_label)
         
-        self.join_status_label = self.style_manager.create_label(self.parent, "", "status")
+        self.join_status_label = self.style_manager.create_label(self.frame, "", "status")
         self.join_status_label.pack(pady=10)
-        self._add_widget(self.join_status_label)
         
         self.sync_btn = self.style_manager.create_button(
-            self.parent, "SYNC", self.callbacks.on_sync_requested, "big", "disabled"
+            self.frame, "SYNC", self.callbacks.on_sync_requested, "big", "disabled"
         )
         self.sync_btn.pack(pady=30)
-        self._add_widget(self.sync_btn)
 
         back_btn = self.style_manager.create_button(
-            self.parent, "Back", self.callbacks.on_back_requested, "secondary"
+            self.frame, "Back", self.callbacks.on_back_requested, "secondary"
         )
         back_btn.pack(pady=10)
-        self._add_widget(back_btn)
+    
+    def _on_show(self) -> None:
+        # The previous room was left on the way out, so start without one
+        self.current_room_id = None
+        self.current_username = None
+        self._topic = None
+        
+        if self.join_status_label:
+            self.join_status_label.config(text="")
+        if self.sync_btn:
+            self.sync_btn.config(state="disabled")
+        
+        if not ObserverView._hotkey_registered:
+            keyboard.add_hotkey('alt+ctrl+s', self._on_hotkey_pressed, suppress=False)
+            ObserverView._hotkey_registered = True
     
     def _on_join_clicked(self) -> None:
         if not self.room_entry or not self.username_entry:
@@ -470,6 +574,7 @@ class ObserverView(BaseView):
         
         self.current_room_id = room_id
         self.current_username = username
+        self._topic = f"{room_id}/{username}"
         self.callbacks.on_room_joined(room_id, username)
     
     def update_join_status(self, room_id: str, username: str) -> None:
@@ -484,73 +589,100 @@ class ObserverView(BaseView):
     def get_current_username(self) -> Optional[str]:
         return self.current_username
     
-    def add_sent_message(self, topic: str, payload: str, timestamp: str) -> None:
+    def get_current_topic(self) -> Optional[str]:
+        return self._topic
+    
+    def add_sent_message(self, topic: str, payload: str | bytes, timestamp: str) -> None:
         if self.messages_text:
+            if isinstance(payload, bytes):
+                payload = payload.decode("utf-8", errors="replace")
             message = f"[{timestamp}] Sent to {topic}: {payload}\n"
             self.messages_text.config(state="normal")
             self.messages_text.insert("end", message)
             self.messages_text.see("end")
             self.messages_text.config(state="disabled")
     
-    def add_received_message(self, topic: str, payload: str, timestamp: str) -> None:
-        print(f"[DEBUG] ObserverView.add_received_message:")
-        print(f"  Topic: {topic}")
-        print(f"  Payload: {payload}")
+    def add_message(self, topic: str, payload: bytes, timestamp: str) -> None:
+        log.debug("ObserverView.add_message: topic=%s payload=%s", topic, payload)
         
         try:
-            data = json.loads(payload)
+            data = orjson.loads(payload)
             action = data.get("action")
             
-            print(f"[DEBUG] Observer processing action: {action}")
+            log.debug("Observer processing action: %s", action)
             
             if action == "TIME_REQ":
                 requester = data.get("requester", "unknown")
                 requester_delay = data.get("requester_delay", 0)
                 main_observer_delay = data.get("main_observer_delay", 0)
                 
-                print(f"[DEBUG] Observer received TIME_REQ:")
-                print(f"  Requester: {requester}")
-                print(f"  Requester delay: {requester_delay}ms")
-                print(f"  Main observer delay: {main_observer_delay}ms")
-                print(f"[DEBUG] Sending TIME_RESPONSE...")
+                log.debug("Observer received TIME_REQ: requester=%s requester_delay=%sms main_observer_delay=%sms",
+                          requester, requester_delay, main_observer_delay)
                 
                 self._handle_time_request(topic, requester, requester_delay, main_observer_delay)
                 
             elif action == "ASSIGN":
                 time_ms = data.get("time_ms", 0)
-                print(f"[DEBUG] Observer received ASSIGN with time: {time_ms}ms")
+                log.debug("Observer received ASSIGN with time: %sms", time_ms)
                 
             elif action == "SYNC_RESPONSE":
                 time_value = data.get("value", 0)
-                print(f"[DEBUG] Observer received SYNC_RESPONSE with time: {time_value}")
-                set_time(time_value)
+                log.debug("Observer received SYNC_RESPONSE with time: %s", time_value)
+                set_time_async(time_value).add_done_callback(self._on_set_time_done)
                 
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"[DEBUG] Observer: Error parsing message: {str(e)}")
+        except (orjson.JSONDecodeError, KeyError) as e:
+            log.debug("Observer: Error parsing message: %s", e)
 
     def _handle_time_request(self, original_topic: str, requester: str, requester_delay: int, main_observer_delay: int) -> None:
         if not self.current_room_id or not self.current_username:
-            print(f"[DEBUG] No current room or username to respond to TIME_REQ")
+            log.debug("No current room or username to respond to TIME_REQ")
+            return
+        
+        # The Replay API is queried off the Tk thread; the reply is sent back on it
+        future = get_current_time_async()
+        future.add_done_callback(
+            lambda f: self.parent.after(
+                0, self._finish_time_request, f, requester, requester_delay, main_observer_delay
+            )
+        )
+    
+    def _finish_time_request(self, future: Future[int], requester: str,
+                             requester_delay: int, main_observer_delay: int) -> None:
+        if not self.current_room_id:
+            return
+        
+        if future.cancelled():
             return
         
-        actual_time = get_current_time()
+        try:
+            actual_time = future.result()
+        except Exception as e:
+            log.error("Could not read the replay time: %s", e)
+            return
 
         response_topic = f"{self.current_room_id}/{requester}"
-        response_payload = json.dumps({
-            "action": "SYNC_RESPONSE",
-            "value": (actual_time + requester_delay - main_observer_delay)/1000
-        })
+        response_payload = _SYNC_RESPONSE_TEMPLATE % ((actual_time + requester_delay - main_observer_delay)/1000)
         
-        print(f"[DEBUG] Sending SYNC_RESPONSE:")
-        print(f"  Topic: {response_topic}")
-        print(f"  Payload: {response_payload}")
+        log.debug("Sending SYNC_RESPONSE: topic=%s payload=%s", response_topic, response_payload)
         
         self.callbacks.on_send_time_response(response_topic, response_payload)
 
+    def _on_set_time_done(self, future: Future) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error:
+            log.error("Could not set the replay time: %s", error)
+
     def _on_hotkey_pressed(self) -> None:
-        print("Alt + Ctrl + S pressed")
+        log.debug("Alt + Ctrl + S pressed")
+        # Same rule as the SYNC button, which stays disabled until a room is joined
+        if not self._topic:
+            return
         self.callbacks.on_sync_requested()
 
     def hide(self) -> None:
-        keyboard.remove_hotkey('alt+ctrl+s')
+        if ObserverView._hotkey_registered:
+            keyboard.remove_hotkey('alt+ctrl+s')
+            ObserverView._hotkey_registered = False
         super().hide()
\ No newline at end of file
@@ -1,20 +1,39 @@
+import re
 import string
 import random
+import time
 from datetime import datetime
 from typing import Optional
 
 
+_ROOM_ALPHABET = string.ascii_uppercase + string.digits
+_choices = random.choices
+
+# (epoch second, formatted time) of the last call; kept as one tuple so threads always see a matching pair
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+_ROOM_ID_RE = re.compile(r"[A-Z0-9]+")
+# Deletes every character allowed in a username; a valid name translates to ""
+_USERNAME_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + "-")
+
+
 def generate_room_id(length: int = 5) -> str:
 
-    characters = string.ascii_uppercase + string.digits
-    return ''.join(random.choices(characters, k=length))
+    return ''.join(_choices(_ROOM_ALPHABET, k=length))
 
 
 def format_timestamp(dt: Optional[datetime] = None) -> str:
+    global _timestamp_cache
 
-    if dt is None:
-        dt = datetime.now()
-    return dt.strftime("%H:%M:%S")
+    if dt is not None:
+        return dt.strftime("%H:%M:%S")
+    
+    now = int(time.time())
+    second, formatted = _timestamp_cache
+    if now != second:
+        formatted = time.strftime("%H:%M:%S", time.localtime(now))
+        _timestamp_cache = (now, formatted)
+    return formatted
 
 
 def validate_room_id(room_id: str, expected_length: int = 5) -> bool:
@@ -22,7 +41,7 @@ def validate_room_id(room_id: str, expected_length: int = 5) -> bool:
         return False
     
     room_id = room_id.strip().upper()
-    return len(room_id) == expected_length and room_id.isalnum()
+    return len(room_id) == expected_length and _ROOM_ID_RE.fullmatch(room_id) is not None
 
 
 def validate_username(username: str, min_length: int = 3, max_length: int = 20) -> bool:
@@ -37,8 +56,7 @@ def validate_username(username: str, min_length: int = 3, max_length: int = 20)
         return False
     
     # Verificar caracteres permitidos: letras, números y guiones
-    allowed_chars = string.ascii_letters + string.digits + '-'
-    return all(char in allowed_chars for char in username)
+    return not username.translate(_USERNAME_DELETE)
 
 
 def validate_mqtt_config(url: str, port: str) -> tuple[bool, Optional[str]]:
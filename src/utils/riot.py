@@ -1,6 +1,30 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+
+REPLAY_PLAYBACK_URL = "https://127.0.0.1:2999/replay/playback"
+
+# Requests that may be in flight at once; each worker thread gets its own pooled connection
+MAX_IN_FLIGHT_REQUESTS = 4
+
+# The Replay API uses a self-signed certificate on localhost
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# One pooled keep-alive session, so calls reuse the TLS connection instead of handshaking each time
+_session = requests.Session()
+_session.verify = False
+_session.headers.update({"Connection": "keep-alive"})
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_IN_FLIGHT_REQUESTS, max_retries=0))
+
+# Worker threads so Replay API round-trips never block the Tk main loop
+_executor = ThreadPoolExecutor(max_workers=MAX_IN_FLIGHT_REQUESTS, thread_name_prefix="riot")
+
+
 def get_current_time() -> int:
-    response = requests.get("https://127.0.0.1:2999/replay/playback", verify=False)
+    response = _session.get(REPLAY_PLAYBACK_URL, timeout=0.5)
     return response.json()["time"]*1000
 
 
@@ -13,5 +37,18 @@ def set_time(time: int) -> None:
         "speed": 1,
         "time": time
     }
-    response = requests.post("https://127.0.0.1:2999/replay/playback", json=body, verify=False)
+    response = _session.post(REPLAY_PLAYBACK_URL, json=body, timeout=0.5)
     return response.json()
+
+
+def get_current_time_async() -> Future[int]:
+    return _executor.submit(get_current_time)
+
+
+def set_time_async(time: int) -> Future:
+    return _executor.submit(set_time, time)
+
+
+def shutdown_executor() -> None:
+    # Drop queued requests so closing the app doesn't wait on them
+    _executor.shutdown(wait=False, cancel_futures=True)